@@ -1,5 +1,6 @@
 import gurobipy as gp
 import pandas as pd
+from _env import ENV
 
 #Parameters
 ordering_cost = 3 
@@ -7,16 +8,18 @@ selling_price = 10
 scrap_value = 1
 
 
+newsvendors = range(5)
+demand_cols = ["Demand%i"%n for n in newsvendors]
+
 #Read input data
-data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0)
+data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0, engine="c", dtype=dict.fromkeys(["Probability"] + demand_cols, "float64"), na_filter=False)
 
 scenarios = range(data.shape[0])
-newsvendors = range(5)
 
-exp_demand = [sum(data["Probability"][s]*data["Demand%i"%n][s] for s in scenarios) for n in newsvendors]
+exp_demand = (data["Probability"].to_numpy() @ data[demand_cols].to_numpy()).tolist()
 
 # Create a new model
-model = gp.Model("NewsVendor")
+model = gp.Model("NewsVendor", env=ENV)
 
 # Create variables
 x = model.addVar(vtype=gp.GRB.CONTINUOUS, name="x")  #Ordering quantity
@@ -24,11 +27,10 @@ y = model.addVars(newsvendors, vtype=gp.GRB.CONTINUOUS, name="y")  #Selling quan
 
 
 # Set objective
-model.setObjective(-1.0*ordering_cost*x + (sum(selling_price*y[n] for n in newsvendors) +scrap_value*(x-sum(y[n] for n in newsvendors))), gp.GRB.MAXIMIZE)
+model.setObjective(-1.0*ordering_cost*x + (selling_price*y.sum() +scrap_value*(x-y.sum())), gp.GRB.MAXIMIZE)
 
-for n in newsvendors:
-    model.addConstr(sum(y[n] for n in newsvendors) <= x, "LimitByOrderedAmount%s")
-    model.addConstr(y[n] <= exp_demand[n], "LimitByDemand%s" )
+model.addConstr(y.sum() <= x, "LimitByOrderedAmount")
+model.addConstrs((y[n] <= exp_demand[n] for n in newsvendors), "LimitByDemand")
 
 
 # Optimize model
@@ -1,5 +1,6 @@
 import gurobipy as gp
 import pandas as pd
+from _env import ENV
 
 
 #Parameters
@@ -9,13 +10,13 @@ scrap_value = 1
 
 
 #Read time serie data. Access data with column name and time period. Example: data["Heat demand"][10] --> heat demand in period 10
-data = pd.read_csv("small_case.csv", sep=";",index_col=0, header=0)
+data = pd.read_csv("small_case.csv", sep=";",index_col=0, header=0, engine="c", dtype={"Probability": "float64", "Demand": "float64"}, na_filter=False)
 
 scenarios = range(data.shape[0])
 
 
 # Create a new model
-model = gp.Model("NewsVendor")
+model = gp.Model("NewsVendor", env=ENV)
 
 # Create variables
 x = model.addVar(vtype=gp.GRB.CONTINUOUS, name="x")  #Ordering quantity
@@ -23,7 +24,7 @@ y = model.addVars(scenarios, vtype=gp.GRB.CONTINUOUS, name="y")  #Selling quanti
 
 
 # Set objective
-model.setObjective(-1.0*ordering_cost*x + sum(data["Probability"][s]*(selling_price*y[s]+scrap_value*(x-y[s])) for s in scenarios), gp.GRB.MAXIMIZE)
+model.setObjective(-1.0*ordering_cost*x + gp.quicksum(data["Probability"][s]*(selling_price*y[s]+scrap_value*(x-y[s])) for s in scenarios), gp.GRB.MAXIMIZE)
 
 for s in scenarios:
     model.addConstr(y[s] <= x, "LimitByOrderedAmount%s"%s)
@@ -1,5 +1,6 @@
 import gurobipy as gp
 import pandas as pd
+from _env import ENV
 
 
 #Parameters
@@ -8,14 +9,19 @@ selling_price = 10
 scrap_value = 1
 
 
+newsvendors = range(5)
+demand_cols = ["Demand%i"%n for n in newsvendors]
+
 #Read input data
-data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0)
+data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0, engine="c", dtype=dict.fromkeys(["Probability"] + demand_cols, "float64"), na_filter=False)
 
 scenarios = range(data.shape[0])
-newsvendors = range(5)
+prob = data["Probability"].tolist()
+demand = data[demand_cols].to_numpy()  #demand[s,n]
+y_coef = {(n, s): prob[s]*(selling_price-scrap_value) for n in newsvendors for s in scenarios}
 
 # Create a new model
-model = gp.Model("NewsVendor")
+model = gp.Model("NewsVendor", env=ENV)
 
 # Create variables
 x = model.addVars(newsvendors, vtype=gp.GRB.CONTINUOUS, name="x")  #Ordering quantity
@@ -26,12 +32,11 @@ y = model.addVars(newsvendors, scenarios, vtype=gp.GRB.CONTINUOUS, name="y")  #S
 #         model.addConstr(x[n]==fixed[n])
 
 # Set objective
-model.setObjective(sum(-1.0*ordering_cost*x[n] + sum(data["Probability"][s]*(selling_price*y[n,s]+scrap_value*(x[n]-y[n,s])) for s in scenarios) for n in newsvendors), gp.GRB.MAXIMIZE)
+# sum_n (-c*x[n] + sum_s p[s]*(sp*y[n,s] + sv*(x[n]-y[n,s]))) collected per variable
+model.setObjective((scrap_value*sum(prob) - ordering_cost)*x.sum() + y.prod(y_coef), gp.GRB.MAXIMIZE)
 
-for n in newsvendors:
-    for s in scenarios:
-        model.addConstr(y[n,s] <= x[n], "LimitByOrderedAmount%s"%s)
-        model.addConstr(y[n,s] <= data["Demand%i"%n][s], "LimitByDemand%s" %s)
+model.addConstrs((y[n,s] <= x[n] for n in newsvendors for s in scenarios), "LimitByOrderedAmount")
+model.addConstrs((y[n,s] <= demand[s,n] for n in newsvendors for s in scenarios), "LimitByDemand")
 
 
 # Optimize model
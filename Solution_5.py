@@ -1,5 +1,6 @@
 import gurobipy as gp
 import pandas as pd
+from _env import ENV
 
 
 #Parameters
@@ -8,18 +9,20 @@ selling_price = 10
 scrap_value = 1
 
 
+newsvendors = range(5)
+demand_cols = ["Demand%i"%n for n in newsvendors]
+
 #Read input data
-data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0)
+data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0, engine="c", dtype=dict.fromkeys(["Probability"] + demand_cols, "float64"), na_filter=False)
 
 
 scenarios = range(data.shape[0])
-newsvendors = range(5)
 
 
-exp_demand = [sum(data["Probability"][s]*data["Demand%i"%n][s] for s in scenarios) for n in newsvendors]
+exp_demand = (data["Probability"].to_numpy() @ data[demand_cols].to_numpy()).tolist()
 
 # Create a new model
-model = gp.Model("NewsVendor")
+model = gp.Model("NewsVendor", env=ENV)
 
 # Create variables
 x = model.addVars(newsvendors, vtype=gp.GRB.INTEGER, name="x")  #Ordering quantity
@@ -27,7 +30,7 @@ y = model.addVars(newsvendors, vtype=gp.GRB.INTEGER, name="y")  #Selling quantit
 
 
 # Set objective
-model.setObjective(sum(-1.0*ordering_cost*x[n] + selling_price*y[n]+scrap_value*(x[n]-y[n]) for n in newsvendors), gp.GRB.MAXIMIZE)
+model.setObjective(gp.quicksum(-1.0*ordering_cost*x[n] + selling_price*y[n]+scrap_value*(x[n]-y[n]) for n in newsvendors), gp.GRB.MAXIMIZE)
 
 for n in newsvendors:
     model.addConstr(y[n] <= x[n], "LimitByOrderedAmount")
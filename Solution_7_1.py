@@ -1,5 +1,6 @@
 import gurobipy as gp
 import pandas as pd
+from _env import ENV
 
 #Parameters
 ordering_cost = 3 
@@ -7,14 +8,19 @@ selling_price = 10
 scrap_value = 1
 
 
+newsvendors = range(5)
+demand_cols = ["Demand%i"%n for n in newsvendors]
+
 #Read input data
-data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0)
+data = pd.read_csv("large_case_ext.csv", sep=";",index_col=0, header=0, engine="c", dtype=dict.fromkeys(["Probability"] + demand_cols, "float64"), na_filter=False)
 
 scenarios = range(data.shape[0])
-newsvendors = range(5)
+prob = data["Probability"].tolist()
+demand = data[demand_cols].to_numpy()  #demand[s,n]
+y_coef = {(n, s): prob[s]*(selling_price-scrap_value) for n in newsvendors for s in scenarios}
 
 # Create a new model
-model = gp.Model("NewsVendor")
+model = gp.Model("NewsVendor", env=ENV)
 
 # Create variables
 x = model.addVar(vtype=gp.GRB.CONTINUOUS, name="x")  #Ordering quantity
@@ -23,12 +29,12 @@ y = model.addVars(newsvendors, scenarios, vtype=gp.GRB.CONTINUOUS, name="y")  #S
 # model.addConstr(x==61.3850)
 
 # Set objective
-model.setObjective(-1.0*ordering_cost*x + sum(data["Probability"][s]*(sum(selling_price*y[n,s] for n in newsvendors) +scrap_value*(x-sum(y[n,s] for n in newsvendors))) for s in scenarios), gp.GRB.MAXIMIZE)
+# -c*x + sum_s p[s]*(sp*sum_n y[n,s] + sv*(x-sum_n y[n,s])) collected per variable
+model.setObjective((scrap_value*sum(prob) - ordering_cost)*x + y.prod(y_coef), gp.GRB.MAXIMIZE)
+
+model.addConstrs((y.sum("*", s) <= x for s in scenarios), "LimitByOrderedAmount")
 
-for n in newsvendors:
-    for s in scenarios:
-        model.addConstr(sum(y[n,s] for n in newsvendors) <= x, "LimitByOrderedAmount%s"%s)
-        model.addConstr(y[n,s] <= data["Demand%i"%n][s], "LimitByDemand%s" %s)
+model.addConstrs((y[n,s] <= demand[s,n] for n in newsvendors for s in scenarios), "LimitByDemand")
 
 
 # Optimize model
@@ -0,0 +1,15 @@
+import os
+
+import gurobipy as gp
+
+
+#Shared Gurobi environment, started once and without solver log
+ENV = gp.Env(empty=True)
+ENV.setParam("OutputFlag", 0)
+
+#Set NEWSVENDOR_BENCHMARK=1 for deterministic timing runs: single thread, dual simplex
+if os.environ.get("NEWSVENDOR_BENCHMARK"):
+    ENV.setParam("Threads", 1)
+    ENV.setParam("Method", 1)
+
+ENV.start()